@@ -1,5 +1,10 @@
+import argparse
+from dataclasses import dataclass, fields
+
+import numexpr as ne
 import numpy as np
-import matplotlib.pyplot as plt
+from numba import njit, prange, vectorize
+import matplotlib
 
 # --- Constants and Physical Parameters ---
 # Stefan-Boltzmann constant for radiation calculations (W/m²·K⁴)
@@ -10,196 +15,346 @@ latent_heat_vaporization = 2260e3
 density_water = 1000
 # Specific heat capacity of water (J/kg·K)
 heat_capacity_water = 4186
-# Initial saline water volume (liters)
-initial_water_volume = 10
-# Initial salt concentration (g/L), typical seawater
-initial_salt_concentration = 35
-# Surface area of pyramid solar still cover (m²)
-surface_area = 1.5
-# Emissivity of the glass cover
-glass_emissivity = 0.85
 
 # --- Time Array (24 hours simulation) ---
-time_hours = np.arange(0, 24, 1)
+TIME_HOURS = np.arange(0, 24, 1, dtype=np.float64)
+# Clear-sky daylight shape over TIME_HOURS; static, so computed once per process
+_SIN_DAILY = np.maximum(np.sin(np.pi * TIME_HOURS / 24), 0)
+# Shared by every run (and returned in the results), so keep them read-only
+TIME_HOURS.flags.writeable = False
+_SIN_DAILY.flags.writeable = False
+
+
+@dataclass
+class PyramidConfig:
+    """Still geometry, initial charge and random seed for one 24-hour run."""
+    # Initial saline water volume (liters)
+    initial_water_volume: float = 10
+    # Initial salt concentration (g/L), typical seawater
+    initial_salt_concentration: float = 35
+    # Surface area of pyramid solar still cover (m²)
+    surface_area: float = 1.5
+    # Emissivity of the glass cover
+    glass_emissivity: float = 0.85
+    # Seed for the weather / measurement noise
+    seed: int = 42
 
-# --- Solar Radiation Simulation (W/m²) ---
-# Using sinusoidal solar pattern + randomness for realism
-np.random.seed(42)
-solar_radiation = (
-    500
-    + 400 * np.maximum(np.sin(np.pi * time_hours / 24), 0)
-    + np.random.normal(0, 30, size=len(time_hours))
-)
 
-# --- Water & Glass Temperature Simulation (°C) ---
-water_temp = 20 + (solar_radiation / 100) + np.random.normal(0, 0.5, size=len(time_hours))
-glass_temp = water_temp - 2 + np.random.normal(0, 0.3, size=len(time_hours))
+@dataclass
+class PyramidResults:
+    """Hourly series from `simulate`; volume, fresh water and salt arrays have one extra initial entry.
+
+    `simulate_ensemble` returns the same fields with a leading run axis (except `time_hours`).
+    """
+    time_hours: np.ndarray
+    solar_radiation: np.ndarray
+    water_temp: np.ndarray
+    glass_temp: np.ndarray
+    cond_efficiency: np.ndarray  # Fraction (0.70-0.95)
+    evaporation_rate: np.ndarray
+    cumulative_fresh_water: np.ndarray
+    remaining_saline_water: np.ndarray
+    salt_concentration: np.ndarray
+    energy_absorbed: np.ndarray
+    energy_lost: np.ndarray
+
 
 # --- Condensation Efficiency Calculation ---
-# Modeled using logistic function: increases with glass temp
-cond_efficiency = 90 / (1 + np.exp(-(glass_temp - 25) / 2)) + np.random.normal(0, 2, size=len(time_hours))
-cond_efficiency = np.clip(cond_efficiency, 70, 95)  # Realistic bounds
+# Modeled using logistic function: increases with glass temp.
+# Compiled as a NumPy ufunc so the element-wise exp loop can be SIMD-vectorized.
+@vectorize(["f8(f8)"], cache=True)
+def condensation_logistic(glass_temp):
+    return 90 / (1 + np.exp(-(glass_temp - 25) / 2))
 
-# --- Evaporation and Salt Concentration Tracking ---
-salt_concentration = [initial_salt_concentration]
-evaporation_rate = []
-cumulative_fresh_water = [0]
-remaining_saline_water = [initial_water_volume]
 
 # --- Evaporation Calculation Per Hour ---
-# Evaporation rate influenced by solar radiation, salt concentration, and condensation efficiency
-for t in range(len(time_hours)):
-    current_salt = salt_concentration[-1]
-    evap_rate = (
-        (0.0003 * solar_radiation[t])  # Proportional to solar input
-        * (1 - (current_salt / 300))   # Salt reduces evaporation
-        * cond_efficiency[t] / 100     # Condensation effectiveness
+# Evaporation rate influenced by solar radiation, salt concentration, and condensation efficiency.
+# Only the evaporation rate carries state (it depends on the current salt concentration),
+# so the kernel tracks just the scalar volume/salt and everything else is derived afterwards.
+# Each row is an independent run, so rows are spread across threads.
+@njit("f8[:, ::1](f8[:, ::1], f8[:, ::1], f8[:, ::1], f8, f8)", parallel=True, cache=True)
+def simulate_evaporation(solar, cond_eff, noise, initial_volume, initial_salt):
+    n_runs, n = solar.shape
+    evap = np.empty((n_runs, n))
+    salt_mass = initial_salt * initial_volume
+    for run in prange(n_runs):
+        volume = initial_volume
+        salt = initial_salt
+        for t in range(n):
+            rate = (
+                (0.0003 * solar[run, t])       # Proportional to solar input
+                * (1 - (salt / 300))           # Salt reduces evaporation
+                * cond_eff[run, t]             # Condensation effectiveness (fraction)
+            )
+            rate *= 1.0 + 0.05 * noise[run, t]  # Add slight random variation (5% std)
+            if rate < 0:                         # Prevent negative rates
+                rate = 0.0
+            evap[run, t] = rate
+
+            # Update system state
+            volume = max(volume - rate, 0.0)
+            if volume > 0:
+                salt = salt_mass / volume
+    return evap
+
+
+def simulate_ensemble(cfg: PyramidConfig, n_runs: int) -> PyramidResults:
+    """Run `n_runs` independent weather realisations at once; every series gets a leading run axis."""
+    time_hours = TIME_HOURS
+    shape = (n_runs, len(time_hours))
+
+    # --- Solar Radiation Simulation (W/m²) ---
+    # Using sinusoidal solar pattern + randomness for realism
+    rng = np.random.default_rng(cfg.seed)
+    solar_radiation = (
+        500
+        + 400 * _SIN_DAILY
+        + rng.normal(0, 30, size=shape)
     )
-    # Add slight random variation
-    evap_rate += np.random.normal(0, evap_rate * 0.05)
-    evap_rate = max(evap_rate, 0)  # Prevent negative rates
-    evaporation_rate.append(evap_rate)
-
-    # Update system state
-    new_volume = remaining_saline_water[-1] - evap_rate
-    new_volume = max(new_volume, 0)
-    remaining_saline_water.append(new_volume)
-    cumulative_fresh_water.append(cumulative_fresh_water[-1] + evap_rate)
-    
-    if new_volume > 0:
-        salt_concentration.append((current_salt * remaining_saline_water[-2]) / new_volume)
-    else:
-        salt_concentration.append(current_salt)
 
-instantaneous_fw = evaporation_rate  # Instantaneous fresh water each hour
+    # --- Water & Glass Temperature Simulation (°C) ---
+    water_temp = 20 + (solar_radiation / 100) + rng.normal(0, 0.5, size=shape)
+    glass_temp = water_temp - 2 + rng.normal(0, 0.3, size=shape)
+
+    # --- Condensation Efficiency Calculation ---
+    cond_efficiency = condensation_logistic(glass_temp) + rng.normal(0, 2, size=shape)
+    np.clip(cond_efficiency, 70, 95, out=cond_efficiency)  # Realistic bounds (%)
+    np.multiply(cond_efficiency, 0.01, out=cond_efficiency)  # Percent -> fraction for the kernel
+
+    noise = rng.standard_normal(shape)  # Drawn up front instead of once per hour
+    evaporation_rate = simulate_evaporation(
+        np.ascontiguousarray(solar_radiation, dtype=np.float64),
+        np.ascontiguousarray(cond_efficiency, dtype=np.float64),
+        np.ascontiguousarray(noise, dtype=np.float64),
+        float(cfg.initial_water_volume),
+        float(cfg.initial_salt_concentration),
+    )
+    salt_mass = cfg.initial_salt_concentration * cfg.initial_water_volume  # Total salt (g), conserved
+
+    # --- Volume, Fresh Water and Salt Tracking (vectorized) ---
+    # Index t + 1 holds the state at the end of hour t; index 0 is the initial state
+    cumulative_fresh_water = np.empty((n_runs, len(time_hours) + 1))
+    cumulative_fresh_water[:, 0] = 0.0
+    np.cumsum(evaporation_rate, axis=-1, out=cumulative_fresh_water[:, 1:])
+    # The still dries out at the first step where cumulative evaporation reaches the initial charge.
+    # Each row is non-decreasing, so counting the entries below the charge is a row-wise
+    # np.searchsorted(row, initial_water_volume) and no per-step clamp is needed.
+    dryout = np.count_nonzero(cumulative_fresh_water < cfg.initial_water_volume, axis=-1)
+    dry = np.arange(len(time_hours) + 1) >= dryout[:, None]
+    remaining_saline_water = np.empty((n_runs, len(time_hours) + 1))
+    np.subtract(cfg.initial_water_volume, cumulative_fresh_water, out=remaining_saline_water)
+    remaining_saline_water[dry] = 0.0
+
+    # Salt mass is conserved, so concentration is salt_mass / volume until the still dries out;
+    # after dryout the last valid concentration is carried forward.
+    salt_concentration = salt_mass / np.where(dry, np.nan, remaining_saline_water)
+    last_wet_salt = np.take_along_axis(salt_concentration, dryout[:, None] - 1, axis=-1)
+    salt_concentration = np.where(dry, last_wet_salt, salt_concentration)
+
+    # --- Energy Absorption & Loss Calculation ---
+    # numexpr fuses each chain into a single pass without intermediate arrays
+    loss_fraction_noise = rng.normal(0, 0.02, size=shape)
+    energy_absorbed = ne.evaluate(
+        "solar_radiation * surface_area * (1 - glass_emissivity)",
+        local_dict={
+            "solar_radiation": solar_radiation,
+            "surface_area": cfg.surface_area,
+            "glass_emissivity": cfg.glass_emissivity,
+        },
+    )
+    energy_lost = ne.evaluate("energy_absorbed * (0.2 + loss_fraction_noise)")
+
+    return PyramidResults(
+        time_hours=time_hours,
+        solar_radiation=solar_radiation,
+        water_temp=water_temp,
+        glass_temp=glass_temp,
+        cond_efficiency=cond_efficiency,
+        evaporation_rate=evaporation_rate,
+        cumulative_fresh_water=cumulative_fresh_water,
+        remaining_saline_water=remaining_saline_water,
+        salt_concentration=salt_concentration,
+        energy_absorbed=energy_absorbed,
+        energy_lost=energy_lost,
+    )
+
+
+def simulate(cfg: PyramidConfig) -> PyramidResults:
+    """Run the 24-hour pyramid still simulation for one configuration."""
+    ensemble = simulate_ensemble(cfg, n_runs=1)
+    return PyramidResults(
+        time_hours=ensemble.time_hours,
+        **{f.name: getattr(ensemble, f.name)[0] for f in fields(PyramidResults) if f.name != "time_hours"},
+    )
 
-# --- Energy Absorption & Loss Calculation ---
-energy_absorbed = solar_radiation * surface_area * (1 - glass_emissivity)
-energy_lost = energy_absorbed * (0.2 + np.random.normal(0, 0.02, size=len(time_hours)))
 
 # =================== RESULTS OUTPUT =================== #
-total_fresh_water = cumulative_fresh_water[-1]
-peak_hour = np.argmax(instantaneous_fw)
-peak_fw = instantaneous_fw[peak_hour]
-
-print("===== Simulation Summary =====")
-print(f"Total fresh water collected in 24 hours: {total_fresh_water:.2f} liters")
-print(f"Maximum fresh water production occurs at hour: {peak_hour}h")
-print(f"Fresh water produced during peak hour: {peak_fw:.3f} liters")
-print("\nInterpretation:")
-print(f"- Freshwater production peaks typically between midday and early afternoon (around hour {peak_hour}),")
-print("  corresponding to maximum solar radiation and higher water/glass temperature difference.")
-print(f"- The system efficiency is well correlated with solar intensity and condensation conditions.\n")
+def print_summary(results: PyramidResults):
+    """Print total and peak fresh water production for one run."""
+    instantaneous_fw = results.evaporation_rate  # Instantaneous fresh water each hour
+    total_fresh_water = results.cumulative_fresh_water[-1]
+    peak_hour = np.argmax(instantaneous_fw)
+    peak_fw = instantaneous_fw[peak_hour]
+
+    print("===== Simulation Summary =====")
+    print(f"Total fresh water collected in 24 hours: {total_fresh_water:.2f} liters")
+    print(f"Maximum fresh water production occurs at hour: {peak_hour}h")
+    print(f"Fresh water produced during peak hour: {peak_fw:.3f} liters")
+    print("\nInterpretation:")
+    print(f"- Freshwater production peaks typically between midday and early afternoon (around hour {peak_hour}),")
+    print("  corresponding to maximum solar radiation and higher water/glass temperature difference.")
+    print(f"- The system efficiency is well correlated with solar intensity and condensation conditions.\n")
+
+
+def print_ensemble_summary(ensemble: PyramidResults):
+    """Print the spread of daily fresh water production across Monte Carlo runs."""
+    totals = ensemble.cumulative_fresh_water[:, -1]
+    p5, p95 = np.percentile(totals, [5, 95])
+    print(f"===== Monte Carlo Summary ({totals.size} runs) =====")
+    print(f"Daily fresh water: {totals.mean():.2f} ± {totals.std():.2f} liters (5-95%: {p5:.2f}-{p95:.2f} liters)\n")
+
 
 # ===================== PLOTS ===================== #
-# (All your plots as you had them)
-
-# 1) Solar Radiation & Water Temperature
-plt.figure(figsize=(10, 5))
-plt.title('Solar Radiation & Water Temperature Over Time')
-ax1 = plt.gca()
-ax2 = ax1.twinx()
-ax1.plot(time_hours, solar_radiation, label='Solar Radiation (W/m²)', color='orange')
-ax2.plot(time_hours, water_temp, label='Water Temp (°C)', color='blue')
-ax1.set_ylabel('Solar Radiation (W/m²)')
-ax2.set_ylabel('Water Temperature (°C)')
-ax1.set_xlabel('Time (hours)')
-ax1.grid()
-plt.xticks(time_hours)
-ax1.legend(loc='upper left')
-ax2.legend(loc='upper right')
-plt.show()
-
-# 2) Salt concentration & cumulative fresh water
-fig, ax1 = plt.subplots(figsize=(10, 5))
-plt.title('Salt Concentration & Cumulative Fresh Water Over Time')
-ax2 = ax1.twinx()
-ax1.plot(time_hours, salt_concentration[:-1], color='brown', label='Salt Concentration (g/L)')
-ax2.plot(time_hours, cumulative_fresh_water[:-1], color='green', label='Cumulative Fresh Water (L)')
-ax1.set_xlabel('Time (hours)')
-ax1.set_ylabel('Salt Concentration (g/L)', color='brown')
-ax2.set_ylabel('Cumulative Fresh Water (L)', color='green')
-ax1.grid()
-plt.xticks(time_hours)
-ax1.legend(loc='upper left')
-ax2.legend(loc='upper right')
-plt.show()
-
-# 3) Cumulative FW, remaining saline water, initial water + instantaneous FW
-plt.figure(figsize=(10, 5))
-plt.title('Water Collection and Volumes Over Time')
-plt.plot(time_hours, cumulative_fresh_water[:-1], label='Cumulative FW (L)', color='green')
-plt.plot(time_hours, remaining_saline_water[:-1], label='Remaining Saline Water (L)', color='red')
-plt.plot(time_hours, [initial_water_volume]*len(time_hours), '--', color='black', label='Initial Water Volume (L)')
-plt.bar(time_hours, instantaneous_fw, label='Instantaneous FW (L/h)', color='purple', alpha=0.5)
-plt.xlabel('Time (hours)')
-plt.grid()
-plt.xticks(time_hours)
-plt.legend()
-plt.show()
-
-# 4) Instantaneous fresh water collected per hour
-plt.figure(figsize=(10, 5))
-plt.title('Instantaneous Fresh Water Collected Per Hour')
-plt.bar(time_hours, instantaneous_fw, color='skyblue')
-plt.xlabel('Time (hours)')
-plt.ylabel('Liters per Hour')
-plt.grid()
-plt.xticks(time_hours)
-plt.show()
-
-# 5) Evaporation rate & salt concentration
-fig, ax1 = plt.subplots(figsize=(10, 5))
-ax1.set_xlabel('Time (hours)')
-ax1.set_ylabel('Evaporation Rate (L/h)', color='blue')
-ax1.plot(time_hours, evaporation_rate, color='blue', label='Evaporation Rate (L/h)')
-ax2 = ax1.twinx()
-ax2.set_ylabel('Salt Concentration (g/L)', color='brown')
-ax2.plot(time_hours, salt_concentration[:-1], color='brown', linestyle='dashed', label='Salt Concentration (g/L)')
-plt.title('Evaporation Rate & Salt Concentration Over Time')
-ax1.grid()
-plt.xticks(time_hours)
-ax1.legend(loc='upper left')
-ax2.legend(loc='upper right')
-plt.show()
-
-# 6) Evaporation rate & solar radiation
-fig, ax1 = plt.subplots(figsize=(10, 5))
-ax1.set_xlabel('Time (hours)')
-ax1.set_ylabel('Evaporation Rate (L/h)', color='blue')
-ax1.plot(time_hours, evaporation_rate, color='blue', label='Evaporation Rate (L/h)')
-ax2 = ax1.twinx()
-ax2.set_ylabel('Solar Radiation (W/m²)', color='orange')
-ax2.plot(time_hours, solar_radiation, color='orange', linestyle='dashed', label='Solar Radiation (W/m²)')
-plt.title('Evaporation Rate & Solar Radiation Over Time')
-ax1.grid()
-plt.xticks(time_hours)
-ax1.legend(loc='upper left')
-ax2.legend(loc='upper right')
-plt.show()
-
-# 7) Energy absorbed & lost
-fig, ax1 = plt.subplots(figsize=(10, 5))
-ax1.set_xlabel('Time (hours)')
-ax1.set_ylabel('Energy Absorbed (J)', color='green')
-ax1.plot(time_hours, energy_absorbed, color='green', label='Energy Absorbed')
-ax2 = ax1.twinx()
-ax2.set_ylabel('Energy Lost (J)', color='red')
-ax2.plot(time_hours, energy_lost, color='red', linestyle='dashed', label='Energy Lost')
-plt.title('Energy Absorbed & Lost Over Time')
-ax1.grid()
-plt.xticks(time_hours)
-ax1.legend(loc='upper left')
-ax2.legend(loc='upper right')
-plt.show()
-
-# 8) Glass temperature & water temperature
-plt.figure(figsize=(10, 5))
-plt.title('Glass & Water Temperature Over Time')
-plt.plot(time_hours, water_temp, color='blue', label='Water Temperature (°C)', linestyle='solid')
-plt.plot(time_hours, glass_temp, color='purple', label='Glass Temperature (°C)', linestyle='dotted')
-plt.xlabel('Time (hours)')
-plt.grid()
-plt.xticks(time_hours)
-plt.legend()
-plt.show()
+def plot_all(results: PyramidResults, output=None):
+    """Draw every result panel on one figure and show it, or save it to `output`."""
+    if output:
+        matplotlib.use("Agg")  # Saving only: skip loading an interactive GUI backend
+    import matplotlib.pyplot as plt
+    plt.rcParams['font.family'] = 'DejaVu Sans'  # Bundled font, avoids font fallback lookups
+
+    time_hours = results.time_hours
+    solar_radiation = results.solar_radiation
+    water_temp = results.water_temp
+    glass_temp = results.glass_temp
+    salt_concentration = results.salt_concentration
+    cumulative_fresh_water = results.cumulative_fresh_water
+    remaining_saline_water = results.remaining_saline_water
+    evaporation_rate = results.evaporation_rate
+    energy_absorbed = results.energy_absorbed
+    energy_lost = results.energy_lost
+
+    fig, axes = plt.subplots(4, 2, figsize=(16, 20))
+
+    # 1) Solar Radiation & Water Temperature
+    ax1 = axes[0, 0]
+    ax1.set_title('Solar Radiation & Water Temperature Over Time')
+    ax2 = ax1.twinx()
+    ax1.plot(time_hours, solar_radiation, label='Solar Radiation (W/m²)', color='orange')
+    ax2.plot(time_hours, water_temp, label='Water Temp (°C)', color='blue')
+    ax1.set_ylabel('Solar Radiation (W/m²)')
+    ax2.set_ylabel('Water Temperature (°C)')
+    ax1.set_xlabel('Time (hours)')
+    ax1.grid()
+    ax1.set_xticks(time_hours)
+    ax1.legend(loc='upper left')
+    ax2.legend(loc='upper right')
+
+    # 2) Salt concentration & cumulative fresh water
+    ax1 = axes[0, 1]
+    ax1.set_title('Salt Concentration & Cumulative Fresh Water Over Time')
+    ax2 = ax1.twinx()
+    ax1.plot(time_hours, salt_concentration[:-1], color='brown', label='Salt Concentration (g/L)')
+    ax2.plot(time_hours, cumulative_fresh_water[:-1], color='green', label='Cumulative Fresh Water (L)')
+    ax1.set_xlabel('Time (hours)')
+    ax1.set_ylabel('Salt Concentration (g/L)', color='brown')
+    ax2.set_ylabel('Cumulative Fresh Water (L)', color='green')
+    ax1.grid()
+    ax1.set_xticks(time_hours)
+    ax1.legend(loc='upper left')
+    ax2.legend(loc='upper right')
+
+    # 3) Cumulative FW, remaining saline water, initial water + instantaneous FW
+    ax = axes[1, 0]
+    ax.set_title('Water Collection and Volumes Over Time')
+    ax.plot(time_hours, cumulative_fresh_water[:-1], label='Cumulative FW (L)', color='green')
+    ax.plot(time_hours, remaining_saline_water[:-1], label='Remaining Saline Water (L)', color='red')
+    ax.plot(time_hours, np.full(len(time_hours), remaining_saline_water[0]), '--', color='black', label='Initial Water Volume (L)')
+    ax.bar(time_hours, evaporation_rate, label='Instantaneous FW (L/h)', color='purple', alpha=0.5)
+    ax.set_xlabel('Time (hours)')
+    ax.grid()
+    ax.set_xticks(time_hours)
+    ax.legend()
+
+    # 4) Instantaneous fresh water collected per hour
+    ax = axes[1, 1]
+    ax.set_title('Instantaneous Fresh Water Collected Per Hour')
+    ax.bar(time_hours, evaporation_rate, color='skyblue')
+    ax.set_xlabel('Time (hours)')
+    ax.set_ylabel('Liters per Hour')
+    ax.grid()
+    ax.set_xticks(time_hours)
+
+    # 5) Evaporation rate & salt concentration
+    ax1 = axes[2, 0]
+    ax1.set_xlabel('Time (hours)')
+    ax1.set_ylabel('Evaporation Rate (L/h)', color='blue')
+    ax1.plot(time_hours, evaporation_rate, color='blue', label='Evaporation Rate (L/h)')
+    ax2 = ax1.twinx()
+    ax2.set_ylabel('Salt Concentration (g/L)', color='brown')
+    ax2.plot(time_hours, salt_concentration[:-1], color='brown', linestyle='dashed', label='Salt Concentration (g/L)')
+    ax1.set_title('Evaporation Rate & Salt Concentration Over Time')
+    ax1.grid()
+    ax1.set_xticks(time_hours)
+    ax1.legend(loc='upper left')
+    ax2.legend(loc='upper right')
+
+    # 6) Evaporation rate & solar radiation
+    ax1 = axes[2, 1]
+    ax1.set_xlabel('Time (hours)')
+    ax1.set_ylabel('Evaporation Rate (L/h)', color='blue')
+    ax1.plot(time_hours, evaporation_rate, color='blue', label='Evaporation Rate (L/h)')
+    ax2 = ax1.twinx()
+    ax2.set_ylabel('Solar Radiation (W/m²)', color='orange')
+    ax2.plot(time_hours, solar_radiation, color='orange', linestyle='dashed', label='Solar Radiation (W/m²)')
+    ax1.set_title('Evaporation Rate & Solar Radiation Over Time')
+    ax1.grid()
+    ax1.set_xticks(time_hours)
+    ax1.legend(loc='upper left')
+    ax2.legend(loc='upper right')
+
+    # 7) Energy absorbed & lost
+    ax1 = axes[3, 0]
+    ax1.set_xlabel('Time (hours)')
+    ax1.set_ylabel('Energy Absorbed (J)', color='green')
+    ax1.plot(time_hours, energy_absorbed, color='green', label='Energy Absorbed')
+    ax2 = ax1.twinx()
+    ax2.set_ylabel('Energy Lost (J)', color='red')
+    ax2.plot(time_hours, energy_lost, color='red', linestyle='dashed', label='Energy Lost')
+    ax1.set_title('Energy Absorbed & Lost Over Time')
+    ax1.grid()
+    ax1.set_xticks(time_hours)
+    ax1.legend(loc='upper left')
+    ax2.legend(loc='upper right')
+
+    # 8) Glass temperature & water temperature
+    ax = axes[3, 1]
+    ax.set_title('Glass & Water Temperature Over Time')
+    ax.plot(time_hours, water_temp, color='blue', label='Water Temperature (°C)', linestyle='solid')
+    ax.plot(time_hours, glass_temp, color='purple', label='Glass Temperature (°C)', linestyle='dotted')
+    ax.set_xlabel('Time (hours)')
+    ax.grid()
+    ax.set_xticks(time_hours)
+    ax.legend()
+
+    fig.tight_layout()
+    if output:
+        fig.savefig(output)
+        plt.close(fig)
+    else:
+        plt.show()
+
+
+if __name__ == "__main__":
+    # --- Command Line Options ---
+    parser = argparse.ArgumentParser(description="Pyramid solar still 24-hour simulation")
+    parser.add_argument("--plot", action="store_true", help="show the result plots after the summary")
+    parser.add_argument("--save", metavar="PATH", help="save the result plots to PATH instead of showing them")
+    parser.add_argument("--runs", type=int, metavar="N", help="also run an N-member Monte Carlo ensemble and print its spread")
+    args = parser.parse_args()
+
+    results = simulate(PyramidConfig())
+    print_summary(results)
+    if args.runs:
+        print_ensemble_summary(simulate_ensemble(PyramidConfig(), args.runs))
+    if args.plot or args.save:
+        plot_all(results, output=args.save)